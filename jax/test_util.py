@@ -32,7 +32,7 @@ from six.moves import xrange
 
 from . import api
 from .config import flags
-from .util import partial
+from .util import partial, memoize
 from .tree_util import tree_multimap, tree_all, tree_map, tree_reduce
 from .lib import xla_bridge
 
@@ -256,11 +256,18 @@ def dtype_str(dtype):
 
 
 def format_shape_dtype_string(shape, dtype):
+  if type(shape) is list:
+    shape = tuple(shape)  # make the cache key hashable
+  return _format_shape_dtype_string(shape, dtype)
+
+
+@memoize
+def _format_shape_dtype_string(shape, dtype):
   if shape is NUMPY_SCALAR_SHAPE:
     return dtype_str(dtype)
   elif shape is PYTHON_SCALAR_SHAPE:
     return 'py' + dtype_str(dtype)
-  elif type(shape) in (list, tuple):
+  elif type(shape) is tuple:
     shapestr = ','.join(str(dim) for dim in shape)
     return '{}[{}]'.format(dtype_str(dtype), shapestr)
   elif type(shape) is int:
@@ -46,10 +46,10 @@ T = lambda x: onp.swapaxes(x, -1, -2)
 float_types = [onp.float32, onp.float64]
 complex_types = [onp.complex64, onp.complex128]
 
+_x64_dtypes = frozenset([onp.dtype('float64'), onp.dtype('complex128')])
+
 def _skip_if_unsupported_type(dtype):
-  dtype = onp.dtype(dtype)
-  if (not FLAGS.jax_enable_x64 and
-      dtype in (onp.dtype('float64'), onp.dtype('complex128'))):
+  if not FLAGS.jax_enable_x64 and onp.dtype(dtype) in _x64_dtypes:
     raise unittest.SkipTest("--jax_enable_x64 is not set")
 
 
@@ -60,11 +60,12 @@ class NumpyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_shape={}".format(jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(1, 1), (4, 4), (2, 5, 5), (200, 200), (1000, 0, 0)]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
-  def testCholesky(self, shape, dtype, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testCholesky(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     def args_maker():
       factor_shape = shape[:-1] + (2 * shape[-1],)
@@ -85,11 +86,12 @@ class NumpyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_n={}".format(jtu.format_shape_dtype_string((n,n), dtype)),
-       "n": n, "dtype": dtype, "rng": rng}
+       "n": n, "dtype": dtype, "rng_factory": rng_factory}
       for n in [0, 4, 5, 25]  # TODO(mattjj): complex64 unstable on large sizes?
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
-  def testDet(self, n, dtype, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testDet(self, n, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     args_maker = lambda: [rng((n, n), dtype)]
 
@@ -104,13 +106,14 @@ class NumpyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_shape={}".format(jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(0, 0), (1, 1), (3, 3), (4, 4), (10, 10), (200, 200),
                     (2, 2, 2), (2, 3, 3), (3, 2, 2)]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   @jtu.skip_on_devices("tpu")
-  def testSlogdet(self, shape, dtype, rng):
+  def testSlogdet(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     args_maker = lambda: [rng(shape, dtype)]
 
@@ -121,12 +124,13 @@ class NumpyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_shape={}".format(jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(1, 1), (4, 4), (5, 5), (2, 7, 7)]
       for dtype in float_types
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   @jtu.skip_on_devices("tpu")
-  def testSlogdetGrad(self, shape, dtype, rng):
+  def testSlogdetGrad(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     a = rng(shape, dtype)
     jtu.check_grads(np.linalg.slogdet, (a,), 2, atol=1e-1, rtol=1e-1)
@@ -141,14 +145,15 @@ class NumpyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name": "_shape={}".format(
            jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(0, 0), (4, 4), (5, 5), (50, 50), (2, 6, 6)]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   # TODO(phawkins): enable when there is an eigendecomposition implementation
   # for GPU/TPU.
   @jtu.skip_on_devices("gpu", "tpu")
-  def testEig(self, shape, dtype, rng):
+  def testEig(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     n = shape[-1]
     args_maker = lambda: [rng(shape, dtype)]
@@ -168,12 +173,13 @@ class NumpyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_shape={}".format(jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(1, 1), (4, 4), (5, 5)]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   @jtu.skip_on_devices("gpu", "tpu")
-  def testEigBatching(self, shape, dtype, rng):
+  def testEigBatching(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     shape = (10,) + shape
     args = rng(shape, dtype)
@@ -184,15 +190,16 @@ class NumpyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name": "_n={}_lower={}".format(
            jtu.format_shape_dtype_string((n,n), dtype), lower),
-       "n": n, "dtype": dtype, "lower": lower, "rng": rng}
+       "n": n, "dtype": dtype, "lower": lower, "rng_factory": rng_factory}
       for n in [0, 4, 5, 50]
       for dtype in float_types + complex_types
       for lower in [False, True]
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   # TODO(phawkins): enable when there is an eigendecomposition implementation
   # for TPU.
   @jtu.skip_on_devices("tpu")
-  def testEigh(self, n, dtype, lower, rng):
+  def testEigh(self, n, dtype, lower, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     args_maker = lambda: [rng((n, n), dtype)]
 
@@ -217,15 +224,17 @@ class NumpyLinalgTest(jtu.JaxTestCase):
       {"testcase_name":
        "_shape={}_lower={}".format(jtu.format_shape_dtype_string(shape, dtype),
                                    lower),
-       "shape": shape, "dtype": dtype, "rng": rng, "lower":lower}
+       "shape": shape, "dtype": dtype,
+       "rng_factory": rng_factory, "lower":lower}
       for shape in [(1, 1), (4, 4), (5, 5), (50, 50)]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]
+      for rng_factory in [jtu.rand_default]
       for lower in [True, False]))
   # TODO(phawkins): enable when there is an eigendecomposition implementation
   # for TPU.
   @jtu.skip_on_devices("tpu")
-  def testEighGrad(self, shape, dtype, rng, lower):
+  def testEighGrad(self, shape, dtype, rng_factory, lower):
+    rng = rng_factory()
     self.skipTest("Test fails with numeric errors.")
     uplo = "L" if lower else "U"
     a = rng(shape, dtype)
@@ -244,16 +253,18 @@ class NumpyLinalgTest(jtu.JaxTestCase):
       {"testcase_name":
        "_shape={}_lower={}".format(jtu.format_shape_dtype_string(shape, dtype),
                                    lower),
-       "shape": shape, "dtype": dtype, "rng": rng, "lower":lower, "eps":eps}
+       "shape": shape, "dtype": dtype,
+       "rng_factory": rng_factory, "lower":lower, "eps":eps}
       for shape in [(1, 1), (4, 4), (5, 5), (50, 50)]
       for dtype in complex_types
-      for rng in [jtu.rand_default()]
+      for rng_factory in [jtu.rand_default]
       for lower in [True, False]
       for eps in [1e-4]))
   # TODO(phawkins): enable when there is an eigendecomposition implementation
   # for TPU.
   @jtu.skip_on_devices("tpu")
-  def testEighGradVectorComplex(self, shape, dtype, rng, lower, eps):
+  def testEighGradVectorComplex(self, shape, dtype, rng_factory, lower, eps):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     # Special case to test for complex eigenvector grad correctness.
     # Exact eigenvector coordinate gradients are hard to test numerically for complex
@@ -273,25 +284,28 @@ class NumpyLinalgTest(jtu.JaxTestCase):
     new_a = a + a_dot
     new_w, new_v = f(new_a)
     new_a = (new_a + onp.conj(new_a.T)) / 2
+    v_dv = v + dv
+    new_a_v_dv = onp.dot(new_a, v_dv)
     # Assert rtol eigenvalue delta between perturbed eigenvectors vs new true eigenvalues.
     RTOL=1e-2
     assert onp.max(
-      onp.abs((onp.diag(onp.dot(onp.conj((v+dv).T), onp.dot(new_a,(v+dv)))) - new_w) / new_w)) < RTOL
+      onp.abs((onp.einsum('ji,ji->i', onp.conj(v_dv), new_a_v_dv) - new_w) / new_w)) < RTOL
     # Redundant to above, but also assert rtol for eigenvector property with new true eigenvalues.
     assert onp.max(
-      onp.linalg.norm(onp.abs(new_w*(v+dv) - onp.dot(new_a, (v+dv))), axis=0) /
-      onp.linalg.norm(onp.abs(new_w*(v+dv)), axis=0)
+      onp.linalg.norm(onp.abs(new_w*v_dv - new_a_v_dv), axis=0) /
+      onp.linalg.norm(onp.abs(new_w*v_dv), axis=0)
     ) < RTOL
 
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_shape={}".format(jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(1, 1), (4, 4), (5, 5)]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   @jtu.skip_on_devices("tpu")
-  def testEighBatching(self, shape, dtype, rng):
+  def testEighBatching(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     shape = (10,) + shape
     args = rng(shape, dtype)
@@ -304,7 +318,7 @@ class NumpyLinalgTest(jtu.JaxTestCase):
       {"testcase_name": "_shape={}_ord={}_axis={}_keepdims={}".format(
          jtu.format_shape_dtype_string(shape, dtype), ord, axis, keepdims),
        "shape": shape, "dtype": dtype, "axis": axis, "keepdims": keepdims,
-       "ord": ord, "rng": rng}
+       "ord": ord, "rng_factory": rng_factory}
       for axis, shape in [
         (None, (1,)), (None, (7,)), (None, (5, 8)),
         (0, (9,)), (0, (4, 5)), ((1,), (10, 7, 3)), ((-2,), (4, 8)),
@@ -319,8 +333,9 @@ class NumpyLinalgTest(jtu.JaxTestCase):
              (isinstance(axis, tuple) and len(axis) == 1)
           else [None, 'fro', 1, 2, -1, -2, np.inf, -np.inf, 'nuc'])
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
-  def testNorm(self, shape, dtype, ord, axis, keepdims, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testNorm(self, shape, dtype, ord, axis, keepdims, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     if (ord in ('nuc', 2, -2) and (
         jtu.device_under_test() != "cpu" or
@@ -341,16 +356,17 @@ class NumpyLinalgTest(jtu.JaxTestCase):
           jtu.format_shape_dtype_string(b + (m, n), dtype), full_matrices,
           compute_uv),
        "b": b, "m": m, "n": n, "dtype": dtype, "full_matrices": full_matrices,
-       "compute_uv": compute_uv, "rng": rng}
+       "compute_uv": compute_uv, "rng_factory": rng_factory}
       for b in [(), (3,), (2, 3)]
       for m in [2, 7, 29, 53]
       for n in [2, 7, 29, 53]
       for dtype in float_types + complex_types
       for full_matrices in [False, True]
       for compute_uv in [False, True]
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   @jtu.skip_on_devices("tpu")
-  def testSVD(self, b, m, n, dtype, full_matrices, compute_uv, rng):
+  def testSVD(self, b, m, n, dtype, full_matrices, compute_uv, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     if b != () and jax.lib.version <= (0, 1, 28):
       raise unittest.SkipTest("Batched SVD requires jaxlib 0.1.29")
@@ -397,12 +413,13 @@ class NumpyLinalgTest(jtu.JaxTestCase):
       {"testcase_name": "_shape={}_fullmatrices={}".format(
           jtu.format_shape_dtype_string(shape, dtype), full_matrices),
        "shape": shape, "dtype": dtype, "full_matrices": full_matrices,
-       "rng": rng}
+       "rng_factory": rng_factory}
       for shape in [(1, 1), (3, 3), (3, 4), (2, 10, 5), (2, 200, 100)]
       for dtype in float_types + complex_types
       for full_matrices in [False, True]
-      for rng in [jtu.rand_default()]))
-  def testQr(self, shape, dtype, full_matrices, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testQr(self, shape, dtype, full_matrices, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     if (onp.issubdtype(dtype, onp.complexfloating) and
         (jtu.device_under_test() == "tpu" or jax.lib.version <= (0, 1, 27))):
@@ -417,12 +434,15 @@ class NumpyLinalgTest(jtu.JaxTestCase):
     a = rng(shape, dtype)
     lq, lr = np.linalg.qr(a, mode=mode)
 
-    # onp.linalg.qr doesn't support batch dimensions. But it seems like an
-    # inevitable extension so we support it in our version.
-    nq = onp.zeros(shape[:-2] + (m, k), dtype)
-    nr = onp.zeros(shape[:-2] + (k, n), dtype)
-    for index in onp.ndindex(*shape[:-2]):
-      nq[index], nr[index] = onp.linalg.qr(a[index], mode=mode)
+    # onp.linalg.qr only supports batch dimensions from numpy 1.22 on; for
+    # older versions we loop over the batch ourselves.
+    if numpy_version >= (1, 22):
+      nq, nr = onp.linalg.qr(a, mode=mode)
+    else:
+      nq = onp.zeros(shape[:-2] + (m, k), dtype)
+      nr = onp.zeros(shape[:-2] + (k, n), dtype)
+      for index in onp.ndindex(*shape[:-2]):
+        nq[index], nr[index] = onp.linalg.qr(a[index], mode=mode)
 
     max_rank = max(m, n)
 
@@ -456,11 +476,12 @@ class NumpyLinalgTest(jtu.JaxTestCase):
       {"testcase_name": "_shape={}".format(
           jtu.format_shape_dtype_string(shape, dtype)),
        "shape": shape, "dtype": dtype,
-       "rng": rng}
+       "rng_factory": rng_factory}
       for shape in [(10, 4, 5), (5, 3, 3), (7, 6, 4)]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
-  def testQrBatching(self, shape, dtype, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testQrBatching(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     args = rng(shape, np.float32)
     qs, rs = vmap(jsp.linalg.qr)(args)
     self.assertTrue(onp.all(onp.linalg.norm(args - onp.matmul(qs, rs)) < 1e-3))
@@ -471,7 +492,7 @@ class NumpyLinalgTest(jtu.JaxTestCase):
            jtu.format_shape_dtype_string(lhs_shape, dtype),
            jtu.format_shape_dtype_string(rhs_shape, dtype)),
        "lhs_shape": lhs_shape, "rhs_shape": rhs_shape, "dtype": dtype,
-       "rng": rng}
+       "rng_factory": rng_factory}
       for lhs_shape, rhs_shape in [
           ((1, 1), (1, 1)),
           ((4, 4), (4,)),
@@ -480,8 +501,9 @@ class NumpyLinalgTest(jtu.JaxTestCase):
           ((2, 1, 3, 3), (2, 4, 3, 4)),
       ]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
-  def testSolve(self, lhs_shape, rhs_shape, dtype, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testSolve(self, lhs_shape, rhs_shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     args_maker = lambda: [rng(lhs_shape, dtype), rng(rhs_shape, dtype)]
 
@@ -492,11 +514,12 @@ class NumpyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_shape={}".format(jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(1, 1), (4, 4), (2, 5, 5), (200, 200), (5, 5, 5)]
       for dtype in float_types
-      for rng in [jtu.rand_default()]))
-  def testInv(self, shape, dtype, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testInv(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     if jtu.device_under_test() == "gpu" and shape == (200, 200):
       raise unittest.SkipTest("Test is flaky on GPU")
@@ -559,11 +582,12 @@ class ScipyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_shape={}".format(jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(1, 1), (4, 5), (10, 5), (50, 50)]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
-  def testLu(self, shape, dtype, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testLu(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     args_maker = lambda: [rng(shape, dtype)]
     x, = args_maker()
@@ -579,12 +603,13 @@ class ScipyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_shape={}".format(jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(1, 1), (4, 5), (10, 5), (10, 10), (6, 7, 7)]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   @jtu.skip_on_devices("tpu")  # TODO(phawkins): precision problems on TPU.
-  def testLuGrad(self, shape, dtype, rng):
+  def testLuGrad(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     a = rng(shape, dtype)
     lu = vmap(jsp.linalg.lu) if len(shape) > 2 else jsp.linalg.lu
@@ -593,11 +618,12 @@ class ScipyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_shape={}".format(jtu.format_shape_dtype_string(shape, dtype)),
-       "shape": shape, "dtype": dtype, "rng": rng}
+       "shape": shape, "dtype": dtype, "rng_factory": rng_factory}
       for shape in [(4, 5), (6, 5)]
       for dtype in [np.float32]
-      for rng in [jtu.rand_default()]))
-  def testLuBatching(self, shape, dtype, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testLuBatching(self, shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     args = [rng(shape, np.float32) for _ in range(10)]
     expected = list(osp.linalg.lu(x) for x in args)
@@ -613,11 +639,12 @@ class ScipyLinalgTest(jtu.JaxTestCase):
   @parameterized.named_parameters(jtu.cases_from_list(
       {"testcase_name":
        "_n={}".format(jtu.format_shape_dtype_string((n,n), dtype)),
-       "n": n, "dtype": dtype, "rng": rng}
+       "n": n, "dtype": dtype, "rng_factory": rng_factory}
       for n in [1, 4, 5, 200]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
-  def testLuFactor(self, n, dtype, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testLuFactor(self, n, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     args_maker = lambda: [rng((n, n), dtype)]
 
@@ -625,9 +652,13 @@ class ScipyLinalgTest(jtu.JaxTestCase):
     lu, piv = jsp.linalg.lu_factor(x)
     l = onp.tril(lu, -1) + onp.eye(n, dtype=dtype)
     u = onp.triu(lu)
+    # Apply the row swaps to an index vector, then permute x's rows once.
+    piv = onp.asarray(piv)
+    perm = onp.arange(n)
     for i in range(n):
-      x[[i, piv[i]],] = x[[piv[i], i],]
-    self.assertAllClose(x, onp.matmul(l, u), check_dtypes=True, rtol=1e-3)
+      perm[i], perm[piv[i]] = perm[piv[i]], perm[i]
+    self.assertAllClose(x[perm], onp.matmul(l, u), check_dtypes=True,
+                        rtol=1e-3)
     self._CompileAndCheck(jsp.linalg.lu_factor, args_maker, check_dtypes=True)
 
   @parameterized.named_parameters(jtu.cases_from_list(
@@ -637,7 +668,7 @@ class ScipyLinalgTest(jtu.JaxTestCase):
            jtu.format_shape_dtype_string(rhs_shape, dtype),
            trans),
        "lhs_shape": lhs_shape, "rhs_shape": rhs_shape, "dtype": dtype,
-       "trans": trans, "rng": rng}
+       "trans": trans, "rng_factory": rng_factory}
       for lhs_shape, rhs_shape in [
           ((1, 1), (1, 1)),
           ((4, 4), (4,)),
@@ -645,8 +676,9 @@ class ScipyLinalgTest(jtu.JaxTestCase):
       ]
       for trans in [0, 1, 2]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
-  def testLuSolve(self, lhs_shape, rhs_shape, dtype, trans, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testLuSolve(self, lhs_shape, rhs_shape, dtype, trans, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     osp_fun = lambda lu, piv, rhs: osp.linalg.lu_solve((lu, piv), rhs, trans=trans)
     jsp_fun = lambda lu, piv, rhs: jsp.linalg.lu_solve((lu, piv), rhs, trans=trans)
@@ -667,7 +699,7 @@ class ScipyLinalgTest(jtu.JaxTestCase):
            jtu.format_shape_dtype_string(rhs_shape, dtype),
            sym_pos, lower),
        "lhs_shape": lhs_shape, "rhs_shape": rhs_shape, "dtype": dtype,
-       "sym_pos": sym_pos, "lower": lower, "rng": rng}
+       "sym_pos": sym_pos, "lower": lower, "rng_factory": rng_factory}
       for lhs_shape, rhs_shape in [
           ((1, 1), (1, 1)),
           ((4, 4), (4,)),
@@ -679,8 +711,9 @@ class ScipyLinalgTest(jtu.JaxTestCase):
         (True, True),
       ]
       for dtype in float_types + complex_types
-      for rng in [jtu.rand_default()]))
-  def testSolve(self, lhs_shape, rhs_shape, dtype, sym_pos, lower, rng):
+      for rng_factory in [jtu.rand_default]))
+  def testSolve(self, lhs_shape, rhs_shape, dtype, sym_pos, lower, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     if (sym_pos and onp.issubdtype(dtype, onp.complexfloating) and
         jtu.device_under_test() == "tpu"):
@@ -708,7 +741,7 @@ class ScipyLinalgTest(jtu.JaxTestCase):
            lower, transpose_a, unit_diagonal),
        "lower": lower, "transpose_a": transpose_a,
        "unit_diagonal": unit_diagonal, "lhs_shape": lhs_shape,
-       "rhs_shape": rhs_shape, "dtype": dtype, "rng": rng}
+       "rhs_shape": rhs_shape, "dtype": dtype, "rng_factory": rng_factory}
       for lower in [False, True]
       for transpose_a in [False, True]
       for unit_diagonal in [False, True]
@@ -718,9 +751,10 @@ class ScipyLinalgTest(jtu.JaxTestCase):
           ((2, 8, 8), (2, 8, 10)),
       ]
       for dtype in float_types
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   def testSolveTriangular(self, lower, transpose_a, unit_diagonal, lhs_shape,
-                          rhs_shape, dtype, rng):
+                          rhs_shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     k = rng(lhs_shape, dtype)
     l = onp.linalg.cholesky(onp.matmul(k, T(k))
@@ -734,14 +768,16 @@ class ScipyLinalgTest(jtu.JaxTestCase):
       a = l
     a = a if lower else T(a)
 
-    inv = onp.linalg.inv(T(a) if transpose_a else a).astype(a.dtype)
-    if len(lhs_shape) == len(rhs_shape):
-      onp_ans = onp.matmul(inv, b)
-    else:
-      onp_ans = onp.einsum("...ij,...j->...i", inv, b)
-
+    osp_fun = partial(osp.linalg.solve_triangular,
+                      trans=1 if transpose_a else 0, lower=lower,
+                      unit_diagonal=unit_diagonal)
     # The standard scipy.linalg.solve_triangular doesn't support broadcasting.
     # But it seems like an inevitable extension so we support it.
+    if len(lhs_shape) > 2:
+      onp_ans = onp.stack([osp_fun(a_i, b_i) for a_i, b_i in zip(a, b)])
+    else:
+      onp_ans = osp_fun(a, b)
+
     ans = jsp.linalg.solve_triangular(
         l if lower else T(l), b, trans=1 if transpose_a else 0, lower=lower,
         unit_diagonal=unit_diagonal)
@@ -756,7 +792,7 @@ class ScipyLinalgTest(jtu.JaxTestCase):
            lower, transpose_a, unit_diagonal),
        "lower": lower, "transpose_a": transpose_a,
        "unit_diagonal": unit_diagonal, "lhs_shape": lhs_shape,
-       "rhs_shape": rhs_shape, "dtype": dtype, "rng": rng}
+       "rhs_shape": rhs_shape, "dtype": dtype, "rng_factory": rng_factory}
       for lower in [False, True]
       for unit_diagonal in [False, True]
       for dtype in float_types + complex_types
@@ -767,10 +803,11 @@ class ScipyLinalgTest(jtu.JaxTestCase):
           ((4, 4), (4, 3)),
           ((2, 8, 8), (2, 8, 10)),
       ]
-      for rng in [jtu.rand_default()]))
+      for rng_factory in [jtu.rand_default]))
   @jtu.skip_on_devices("tpu")  # TODO(phawkins): Test fails on TPU.
   def testSolveTriangularGrad(self, lower, transpose_a, unit_diagonal,
-                              lhs_shape, rhs_shape, dtype, rng):
+                              lhs_shape, rhs_shape, dtype, rng_factory):
+    rng = rng_factory()
     _skip_if_unsupported_type(dtype)
     A = np.tril(rng(lhs_shape, dtype) + 5 * onp.eye(lhs_shape[-1], dtype=dtype))
     A = A if lower else T(A)
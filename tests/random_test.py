@@ -147,7 +147,7 @@ class LaxRandomTest(jtu.JaxTestCase):
       for dtype in [onp.float32, onp.float64, onp.int32, onp.int64]))
   def testShuffle(self, dtype):
     key = random.PRNGKey(0)
-    x = onp.arange(100).astype(dtype)
+    x = onp.arange(100, dtype=dtype)
     rand = lambda key: random.shuffle(key, x)
     crand = api.jit(rand)
 